@@ -1,4 +1,11 @@
-from genserver.core import GenServer
+from genserver.aio import AsyncTypedGenServer
+from genserver.core import GenServer, dispatch
 from genserver.exceptions import GenServerError, GenServerTimeoutError
 
-__all__ = ["GenServer", "GenServerError", "GenServerTimeoutError"]
+__all__ = [
+    "AsyncTypedGenServer",
+    "GenServer",
+    "GenServerError",
+    "GenServerTimeoutError",
+    "dispatch",
+]
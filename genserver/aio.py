@@ -0,0 +1,402 @@
+"""
+asyncio-based GenServer implementation.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Optional,
+    Tuple,
+)
+
+from genserver.core import (
+    TERMINATE,
+    Cast,
+    Terminate,
+    _resolve_generic_bases,
+    _TypedServerBase,
+)
+from genserver.exceptions import GenServerError, GenServerTimeoutError
+from genserver.typing import CallMsg, CastMsg, StateType
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+class AsyncCall(Generic[CallMsg]):
+    """
+    A synchronous request message sent to an AsyncTypedGenServer.
+
+    The asyncio counterpart of `genserver.core.Call`: the reply is delivered
+    through an `asyncio.Future` the caller awaits.
+
+    Attributes
+    ----------
+    message : CallMsg
+        The actual request payload.
+    correlation_id : int
+        A unique identifier for this call.
+    reply_to : asyncio.Future
+        The future the caller is awaiting for the reply.
+    """
+
+    __slots__ = ("message", "correlation_id", "reply_to")
+
+    def __init__(
+        self, message: CallMsg, correlation_id: int, reply_to: asyncio.Future[Any]
+    ):
+        self.message = message
+        self.correlation_id = correlation_id
+        self.reply_to = reply_to
+
+
+class AsyncTypedGenServer(_TypedServerBase[CastMsg, CallMsg, StateType]):
+    """
+    Typed Generic Server (GenServer) running as an asyncio task.
+
+    Has the same three generic parameters as `TypedGenServer`:
+
+    1. `CastMsg`: The type of cast messages that it accepts.
+    2. `CallMsg`: The type of call messages that it accepts.
+    3. `StateType`: The type of its internal state.
+
+    Instead of a dedicated OS thread per server, the message loop runs as a
+    task on the current event loop, so thousands of servers can share one
+    thread. The callbacks (`init`, `handle_cast`, `handle_call`, `terminate`)
+    are coroutines.
+
+    All methods must be called from the event loop the server was started on.
+    """
+
+    _logger = logger
+
+    def __init__(self) -> None:
+        """
+        Initializes the GenServer with its internal state.
+
+        The mailbox is created in `start`, so that it belongs to the running
+        event loop.
+        """
+        self._mailbox: Optional[
+            asyncio.Queue[Cast[CastMsg] | AsyncCall[CallMsg] | Terminate]
+        ] = None
+        # Exact-type dispatch for the message loop, as in TypedGenServer.
+        self._dispatch: Dict[type, Callable[[Any], Awaitable[None]]] = {
+            AsyncCall: self._process_call,
+            Cast: self._process_cast,
+        }
+        self._task: Optional[asyncio.Task[None]] = None
+        self._running: bool = False
+        self._current_state = None  # type: ignore[assignment]
+        self._next_correlation_id = itertools.count(1).__next__
+
+    def __init_subclass__(cls):
+        super().__init_subclass__()
+
+        # Same type argument resolution as TypedGenServer.__init_subclass__.
+        type_args = _resolve_generic_bases(cls, AsyncTypedGenServer)
+        if type_args is not None:
+            cls._set_types(*type_args)
+
+    # ------------- GenServer Lifecycle Management -------------
+
+    def start(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Starts the GenServer task on the running event loop.
+
+        The task initializes the GenServer's state by awaiting
+        `init(*args, **kwargs)` and then begins processing messages from the
+        mailbox.
+
+        Args:
+            *args: Positional arguments to be passed to the `init` method.
+            **kwargs: Keyword arguments to be passed to the `init` method.
+
+        Raises:
+            GenServerError: If the GenServer is already running.
+            RuntimeError: If there is no running event loop.
+        """
+        if self._running:
+            raise GenServerError("GenServer is already running.")
+        mailbox: asyncio.Queue[Cast[CastMsg] | AsyncCall[CallMsg] | Terminate] = (
+            asyncio.Queue()
+        )
+        self._mailbox = mailbox
+        self._running = True
+        self._task = asyncio.create_task(self._loop(mailbox, *args, **kwargs))
+
+    async def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops the GenServer task gracefully.
+
+        Sends a stop command to the GenServer's mailbox and waits for the task
+        to finish.
+
+        Args:
+            timeout: Optional timeout in seconds to wait for the GenServer to stop.
+                     If None, waits indefinitely until stopped.
+
+        Raises:
+            GenServerError: If the GenServer is not running.
+            TimeoutError: If the GenServer fails to stop within the timeout.
+        """
+        if not self._running or self._mailbox is None:
+            raise GenServerError("GenServer is not running.")
+        self._running = False
+        self._mailbox.put_nowait(TERMINATE)
+        if self._task is None:
+            return
+        try:
+            # Shielded so that a timeout doesn't cancel the server task itself.
+            await asyncio.wait_for(asyncio.shield(self._task), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError("GenServer failed to stop within the timeout.")
+
+    # ------------------- Receiving Messages -------------------
+
+    def cast(self, message: CastMsg) -> None:
+        """
+        Sends an asynchronous message (cast) to the GenServer's mailbox.
+
+        Never blocks: the message is queued and processed by the server task.
+        No response is expected for cast messages.
+
+        Args:
+            message: The message to be sent. Must be of type `CastMsg`.
+
+        Raises:
+            GenServerError: If the GenServer is not running or message is not
+                the correct type.
+        """
+        if not self._running or self._mailbox is None:
+            raise GenServerError("Cannot cast message to a stopped GenServer.")
+        self.assert_cast_msg(message)
+        self._mailbox.put_nowait(Cast(message=message))
+
+    async def call(self, message: CallMsg, timeout: Optional[float] = None) -> Any:
+        """
+        Sends a synchronous message (call) to the GenServer and awaits a response.
+
+        Args:
+            message: The message to be sent. Must be of type `CallMsg`.
+            timeout: Optional timeout in seconds to wait for a response.
+                     If None, waits indefinitely.
+
+        Returns:
+            Any: The response from the GenServer.
+
+        Raises:
+            GenServerError: If the GenServer is not running or message is not
+                the correct type.
+            GenServerTimeoutError: If no response is received within the timeout.
+        """
+        if not self._running or self._mailbox is None:
+            raise GenServerError("Cannot call a stopped GenServer.")
+        self.assert_call_message(message)
+
+        reply_future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        self._mailbox.put_nowait(
+            AsyncCall(
+                message=message,
+                correlation_id=self._next_correlation_id(),
+                reply_to=reply_future,
+            )
+        )
+        try:
+            # On timeout, wait_for cancels the future, which `_reply` checks.
+            return await asyncio.wait_for(reply_future, timeout)
+        except asyncio.TimeoutError:
+            raise GenServerTimeoutError(
+                "No response received for call within timeout: %s seconds.", timeout
+            )
+
+    # ----------------- Responding to Messages -----------------
+
+    def _reply(self, msg: AsyncCall, response: Any) -> None:
+        """
+        Internal method to send a reply to a 'call' message.
+
+        Args:
+            msg: The call message to respond to.
+            response: The response data.
+        """
+        reply_future = msg.reply_to
+        if reply_future.done():
+            logger.warning(
+                "Caller of call %s timed out before the reply was sent.",
+                msg.correlation_id,
+            )
+            return
+        reply_future.set_result(response)
+
+    async def _process_call(self, msg: AsyncCall):
+        """Processes an `AsyncCall` message.
+
+        Same steps as `TypedGenServer._process_call`, awaiting `handle_call`.
+
+        Args:
+            msg (AsyncCall): The message to process.
+        """
+        call_message = msg.message
+        try:
+            state = self._current_state
+            handler = self._call_dispatch.get(type(call_message))
+            if handler is None:
+                response, next_state = await self.handle_call(call_message, state)
+            else:
+                response, next_state = await handler(self, call_message, state)
+            if not self._skip_state_typecheck:
+                self.assert_state(next_state)
+            self._current_state = next_state
+            self._reply(msg, response)
+        except Exception as e:
+            self._reply(msg, self._handle_call_failed(call_message, e))
+
+    async def _process_cast(self, msg: Cast):
+        """Processes a `Cast` message.
+
+        Same steps as `TypedGenServer._process_cast`, awaiting `handle_cast`.
+
+        Args:
+            msg (Cast): The message to process.
+        """
+        cast_message = msg.message
+        try:
+            state = self._current_state
+            handler = self._cast_dispatch.get(type(cast_message))
+            if handler is None:
+                next_state = await self.handle_cast(cast_message, state)
+            else:
+                next_state = await handler(self, cast_message, state)
+            if not self._skip_state_typecheck:
+                self.assert_state(next_state)
+            self._current_state = next_state
+        except Exception:
+            self._handle_cast_failed(cast_message)
+
+    async def _loop(
+        self,
+        mailbox: asyncio.Queue[Cast[CastMsg] | AsyncCall[CallMsg] | Terminate],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """
+        The main message processing loop of the GenServer.
+
+        - Initializes state by awaiting `init`.
+        - Awaits messages from `mailbox` and dispatches them to
+          `handle_cast`/`handle_call`.
+        - Handles exceptions within handlers and logs them.
+        - Awaits `terminate` before exiting the loop.
+
+        Unlike TypedGenServer, there is no batch drain: `mailbox.get()` returns
+        without suspending while the queue is non-empty, so there is no
+        wakeup to amortize.
+        """
+        try:
+            self.current_state = await self.init(*args, **kwargs)
+        except Exception as e:
+            logger.exception("GenServer init failed: %s", e)
+            self._running = False  # Stop if init fails, prevent further processing
+            return
+
+        dispatch = self._dispatch
+        while self._running:
+            try:
+                msg = await mailbox.get()
+                handler = dispatch.get(type(msg))
+                if handler is not None:
+                    await handler(msg)
+                elif isinstance(msg, Terminate):
+                    self._running = False
+                    break
+                elif isinstance(msg, AsyncCall):
+                    await self._process_call(msg)
+                elif isinstance(msg, Cast):
+                    await self._process_cast(msg)
+                else:
+                    logger.warning("Unknown message type received: %s", msg)
+
+            # Catch any unexpected errors in the loop
+            except Exception as main_loop_err:
+                logger.exception("GenServer main loop error: %s", main_loop_err)
+                self._running = False
+                break
+
+        try:
+            await self.terminate(self._current_state)
+        except Exception as e_term:
+            logger.exception("GenServer terminate error: %s", e_term)
+
+    # -------- Callbacks to be Overridden in Subclasses --------
+
+    async def init(self, *args: Any, **kwargs: Any) -> StateType:
+        """
+        Initialization callback.
+
+        Awaited when the GenServer starts. Should return the initial state.
+
+        Args:
+            *args: Arguments passed from `start`.
+            **kwargs: Keyword arguments passed from `start`.
+
+        Returns:
+            State: The initial state of the GenServer.
+        """
+        raise NotImplementedError("init method must be implemented in subclass.")
+
+    async def handle_cast(self, message: CastMsg, state: StateType) -> StateType:
+        """
+        Handles asynchronous cast messages.
+
+        Args:
+            message: The cast message.
+            state: The current state of the GenServer.
+
+        Returns:
+            State: The new state of the GenServer after handling the message.
+        """
+        logger.warning(
+            "Unhandled cast message: %s. Override handle_cast in subclass to handle it.",
+            message,
+        )
+        return state  # Default: return same state
+
+    async def handle_call(
+        self, message: CallMsg, state: StateType
+    ) -> Tuple[Any, StateType]:
+        """
+        Handles synchronous call messages.
+
+        Args:
+            message: The call message.
+            state: The current state of the GenServer.
+
+        Returns:
+            Tuple[Any, State]: The response and the new state of the GenServer.
+
+        Raises:
+            NotImplementedError: If not overridden in subclass.
+        """
+        raise NotImplementedError(
+            "handle_call method must be implemented in subclass to handle calls."
+        )
+
+    async def terminate(self, state: StateType) -> None:
+        """
+        Termination callback.
+
+        Awaited when the GenServer is about to stop.
+
+        Args:
+            state: The current state of the GenServer.
+        """
+        logger.info("GenServer is terminating.")
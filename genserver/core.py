@@ -2,16 +2,27 @@
 Core GenServer implementation.
 """
 
+from __future__ import annotations
+
+import collections
+import functools
+import inspect
+import itertools
 import logging
-import queue
 import threading
-import uuid
+import types
 from typing import (
     Any,
+    Callable,
     Dict,
+    FrozenSet,
     Generic,
+    List,
     Optional,
     Tuple,
+    Type,
+    TypeVar,
+    Union,
     get_args,
     get_origin,
 )
@@ -25,6 +36,48 @@ logger.addHandler(
     logging.NullHandler()
 )  # To avoid 'No handler found' warnings if not configured by user
 
+
+# Log formats for handler failures, shared with genserver.aio.
+_HANDLE_CALL_FAILED_MSG = "GenServer handle_call error for message: %s"
+_HANDLE_CAST_FAILED_MSG = "GenServer handle_cast error for message: %s"
+
+
+# `A | B` hints only exist (as types.UnionType) from Python 3.10 onwards.
+_UNION_TYPES = (Union, getattr(types, "UnionType", Union))
+
+
+def _type_tuple(type_hint: Any) -> Tuple[Any, ...]:
+    """Flattens a type hint into a tuple of types usable with `isinstance`.
+
+    `A | B` and `Union[A, B]` become `(A, B)`; any other hint `T` becomes `(T,)`.
+    """
+    if get_origin(type_hint) in _UNION_TYPES:
+        return get_args(type_hint)
+    return (type_hint,)
+
+
+# Bounded so that classes created on the fly (e.g. in tests) aren't kept alive
+# forever by the cache.
+@functools.lru_cache(maxsize=1024)
+def _resolve_generic_bases(cls: type, origin: type) -> Optional[Tuple[Any, ...]]:
+    """Returns the type arguments that `cls` passes to the generic class `origin`.
+
+    For `class S(TypedGenServer[A, B, C])`, `_resolve_generic_bases(S,
+    TypedGenServer)` is `(A, B, C)`.
+
+    Args:
+        cls: The class being created.
+        origin: The generic base class to look for.
+
+    Returns:
+        The type arguments, or None if no base of `cls` parameterizes `origin`.
+    """
+    for base in getattr(cls, "__orig_bases__", ()):
+        if get_origin(base) is origin:
+            return get_args(base)
+    return None
+
+
 # ___________________ GenServer Messages ___________________
 
 
@@ -37,7 +90,63 @@ class Terminate:
     before shutting down.
     """
 
-    pass
+    __slots__ = ()
+
+
+TERMINATE = Terminate()
+"""The Terminate message posted by `stop`. It carries no data, so it is shared."""
+
+
+class _ReplySlot:
+    """
+    A single-use channel that carries the reply to a `Call` back to its caller.
+
+    Lighter than a `queue.Queue` for transporting exactly one value: the
+    server stores `value` and sets `event`, which the caller waits on. The
+    server and a caller that times out race to acquire `claim`; whichever
+    gets it first decides whether the reply is delivered or dropped, so a
+    reply is never lost without the server noticing.
+    """
+
+    __slots__ = ("claim", "event", "value")
+
+    def __init__(self) -> None:
+        self.claim = threading.Lock()
+        self.event = threading.Event()
+        self.value: Any = None
+
+    def put(self, value: Any) -> bool:
+        """Delivers the reply to the caller.
+
+        Args:
+            value: The reply.
+
+        Returns:
+            bool: False if the caller already gave up waiting, True otherwise.
+        """
+        if not self.claim.acquire(blocking=False):
+            return False
+        self.value = value
+        self.event.set()
+        return True
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Waits for the reply, which is then available as `value`.
+
+        Args:
+            timeout: Optional timeout in seconds. If None, blocks indefinitely.
+
+        Returns:
+            bool: True if the reply was delivered, False if the caller gave up.
+        """
+        if self.event.wait(timeout):
+            return True
+        if self.claim.acquire(blocking=False):
+            return False  # `put` will now see the slot claimed
+        # The server claimed the slot just before the timeout and is storing
+        # the reply right now.
+        self.event.wait()
+        return True
 
 
 class Call(Generic[CallMsg]):
@@ -45,21 +154,26 @@ class Call(Generic[CallMsg]):
     A synchronous request message sent to a TypedGenServer that expects a
     response.
 
-    A Call wraps a request of type `CallMsg` along with a unique
-    `correlation_id` that allows the sender to match the server's reply
-    with the original request.
+    A Call wraps a request of type `CallMsg` along with the `reply_to`
+    channel the server uses to send its reply straight back to the caller,
+    and a unique `correlation_id` used to identify the call in logs.
 
     Attributes
     ----------
     message : CallMsg
         The actual request payload.
-    correlation_id : str
-        A unique identifier that ties this call to its reply.
+    correlation_id : int
+        A unique identifier for this call.
+    reply_to : _ReplySlot
+        The slot the caller is waiting on for the reply.
     """
 
-    def __init__(self, message: CallMsg, correlation_id: str):
+    __slots__ = ("message", "correlation_id", "reply_to")
+
+    def __init__(self, message: CallMsg, correlation_id: int, reply_to: _ReplySlot):
         self.message = message
         self.correlation_id = correlation_id
+        self.reply_to = reply_to
 
 
 class Cast(Generic[CastMsg]):
@@ -75,6 +189,8 @@ class Cast(Generic[CastMsg]):
         The request payload sent to the server.
     """
 
+    __slots__ = ("message",)
+
     def __init__(self, message: CastMsg):
         self.message = message
 
@@ -82,7 +198,226 @@ class Cast(Generic[CastMsg]):
 # _______________________ GenServers _______________________
 
 
-class TypedGenServer(Generic[CastMsg, CallMsg, StateType]):
+class _TypedServerBase(Generic[CastMsg, CallMsg, StateType]):
+    """
+    Type-checking of messages and state shared by the GenServer variants.
+
+    Subclasses resolve their generic type arguments in `__init_subclass__`
+    and store them with `_set_types`.
+    """
+
+    _cast_type: CastMsg
+    _call_type: CallMsg
+    _state_type: StateType
+
+    # The type arguments above, resolved once per subclass: a tuple of types
+    # for `isinstance` and a set of the exact types for a cheaper `type() in`
+    # check on the common path.
+    _cast_type_tuple: Tuple[Any, ...]
+    _cast_type_set: FrozenSet[Any]
+    _call_type_tuple: Tuple[Any, ...]
+    _call_type_set: FrozenSet[Any]
+    _state_type_tuple: Tuple[Any, ...]
+    _state_type_set: FrozenSet[Any]
+
+    # Set to True in a subclass to skip type-checking the state returned by
+    # `handle_cast`/`handle_call` on every message. The initial state returned
+    # by `init` and states set through `current_state` are still checked.
+    _skip_state_typecheck: bool = False
+
+    # The server state. It is only None until `init` has run, and the
+    # callbacks are never invoked before that.
+    _current_state: StateType
+
+    # Exact message type -> handler function, filled in by the `dispatch`
+    # decorator from `singledispatchmethod` registries. Empty by default.
+    _cast_dispatch: Dict[type, Callable[..., Any]] = {}
+    _call_dispatch: Dict[type, Callable[..., Any]] = {}
+
+    def __init_subclass__(cls):
+        super().__init_subclass__()
+        # A subclass that overrides a handler must not inherit the dispatch
+        # table built from its parent's handler.
+        if "handle_cast" in cls.__dict__:
+            cls._cast_dispatch = {}
+        if "handle_call" in cls.__dict__:
+            cls._call_dispatch = {}
+
+    @classmethod
+    def _set_types(cls, cast_t: Any, call_t: Any, state_t: Any) -> None:
+        """Stores the message and state types of a subclass.
+
+        Args:
+            cast_t: The type of cast messages.
+            call_t: The type of call messages.
+            state_t: The type of the server state.
+        """
+        cls._cast_type = cast_t
+        cls._call_type = call_t
+        cls._state_type = state_t
+        cls._cast_type_tuple = _type_tuple(cast_t)
+        cls._cast_type_set = frozenset(cls._cast_type_tuple)
+        cls._call_type_tuple = _type_tuple(call_t)
+        cls._call_type_set = frozenset(cls._call_type_tuple)
+        cls._state_type_tuple = _type_tuple(state_t)
+        cls._state_type_set = frozenset(cls._state_type_tuple)
+
+    # ------------------ Message Type-checking -----------------
+
+    def assert_cast_msg(self, message: CastMsg):
+        """Asserts that the cast message is the correct type.
+
+        Args:
+            message (CastMsg): The message to be checked.
+
+        Raises:
+            GenServerError: If the message is not the correct type.
+        """
+        if type(message) not in self._cast_type_set and not isinstance(
+            message, self._cast_type_tuple
+        ):
+            raise GenServerError(
+                "Expected cast message %s, got %s",
+                self._cast_type,
+                type(message),
+            )
+
+    def assert_call_message(self, message):
+        """Asserts that the call message is the correct type.
+
+        Args:
+            message (CastMsg): The message to be checked.
+
+        Raises:
+            GenServerError: If the message is not the correct type.
+        """
+        if type(message) not in self._call_type_set and not isinstance(
+            message, self._call_type_tuple
+        ):
+            raise GenServerError(
+                "Expected call message %s, got %s",
+                self._call_type,
+                type(message),
+            )
+
+    # -------------------- Handler Failures --------------------
+
+    # The logger handler failures are reported to.
+    _logger: logging.Logger = logger
+
+    # Cold paths: kept out of `_process_call`/`_process_cast` so the happy
+    # path there is just the handler call inside a bare try block.
+
+    def _handle_call_failed(self, message: Any, error: Exception) -> GenServerError:
+        """Logs a failed `handle_call` and builds the error sent to the caller.
+
+        Must be called from the `except` block, so the traceback is logged.
+
+        Args:
+            message: The call message that was being handled.
+            error: The exception raised while handling it.
+
+        Returns:
+            GenServerError: The reply for the caller.
+        """
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._logger.exception(_HANDLE_CALL_FAILED_MSG, message)
+        return GenServerError("handle_call failed: %s", error)
+
+    def _handle_cast_failed(self, message: Any) -> None:
+        """Logs a failed `handle_cast`.
+
+        Must be called from the `except` block, so the traceback is logged.
+
+        Args:
+            message: The cast message that was being handled.
+        """
+        if self._logger.isEnabledFor(logging.ERROR):
+            self._logger.exception(_HANDLE_CAST_FAILED_MSG, message)
+
+    # ---------------------- Server State ----------------------
+
+    @property
+    def current_state(self):
+        """Get or set the current state of the TypedGenServer.
+
+        Returns:
+            StateType: The current state of the TypedGenServer.
+
+        Raises:
+            GenServerError: If the set state is not the correct type.
+        """
+        return self._current_state
+
+    @current_state.setter
+    def current_state(self, value: StateType):
+        self.assert_state(value)
+        self._current_state = value
+
+    def assert_state(self, state: StateType):
+        """Asserts that the state is the correct type.
+
+        Args:
+            state (StateType): The state to be checked.
+
+        Raises:
+            GenServerError: If the state is not the correct type.
+        """
+        if type(state) not in self._state_type_set and not isinstance(
+            state, self._state_type_tuple
+        ):
+            raise GenServerError(
+                "Expected state %s, got %s",
+                self._state_type,
+                type(state),
+            )
+
+
+_ServerClass = TypeVar("_ServerClass", bound=Type[_TypedServerBase])
+
+
+def dispatch(cls: _ServerClass) -> _ServerClass:
+    """Class decorator that speeds up `singledispatchmethod` handlers.
+
+    When `handle_cast` or `handle_call` is a `functools.singledispatchmethod`,
+    every message normally goes through its registry lookup. This decorator
+    copies the registered implementations into a table keyed by the exact
+    message type once, when the class is defined. Messages whose exact type
+    was registered are then dispatched with a single dict lookup; any other
+    message (e.g. a subclass of a registered type) still goes through the
+    handler itself.
+
+    Example:
+        @dispatch
+        class CounterServer(TypedGenServer[Increment | Decrement, GetCount, int]):
+            @singledispatchmethod
+            def handle_cast(self, message, state):
+                return super().handle_cast(message, state)
+
+            @handle_cast.register
+            def _(self, message: Increment, state):
+                return state + 1
+
+    Args:
+        cls: A TypedGenServer, GenServer or AsyncTypedGenServer subclass.
+
+    Returns:
+        The same class.
+    """
+    for handler_name, table_name in (
+        ("handle_cast", "_cast_dispatch"),
+        ("handle_call", "_call_dispatch"),
+    ):
+        handler = inspect.getattr_static(cls, handler_name)
+        if isinstance(handler, functools.singledispatchmethod):
+            registry = handler.dispatcher.registry
+            # `object` is the fallback implementation, reached via the handler
+            table = {t: f for t, f in registry.items() if t is not object}
+            setattr(cls, table_name, table)
+    return cls
+
+
+class TypedGenServer(_TypedServerBase[CastMsg, CallMsg, StateType]):
     """
     Typed Generic Server (GenServer) base class for Python.
 
@@ -98,23 +433,35 @@ class TypedGenServer(Generic[CastMsg, CallMsg, StateType]):
     Handles message queuing, state management, and basic lifecycle.
     """
 
-    _cast_type: CastMsg
-    _call_type: CallMsg
-    _state_type: StateType
-
     def __init__(self) -> None:
         """
         Initializes the GenServer with a message queue and internal state.
         """
-        self._mailbox: queue.Queue[Cast[CastMsg] | Call[CallMsg] | Terminate] = (
-            queue.Queue()
+        # The mailboxes have a single consumer (the server thread), so deques
+        # are enough: append/popleft are atomic under the GIL and only the
+        # shared wakeup needs a synchronization primitive. Casts and calls are
+        # queued separately so that casts don't wait behind every queued call
+        # (see `_receive`); Terminate goes in the call mailbox.
+        self._mailbox_cast: collections.deque[Cast[CastMsg]] = collections.deque()
+        self._mailbox_call: collections.deque[Call[CallMsg] | Terminate] = (
+            collections.deque()
         )
+        self._mailbox_event = threading.Event()
+        # Exact-type dispatch for the message loop; subclasses of the message
+        # types fall back to the isinstance checks in `_loop`.
+        self._dispatch: Dict[type, Callable[[Any], None]] = {
+            Call: self._process_call,
+            Cast: self._process_cast,
+        }
         self._thread: Optional[threading.Thread] = None
+        # Set by the server thread once `terminate` has run; replaced on start.
+        self._stopped_event = threading.Event()
         self._running: bool = False
-        self._current_state: Optional[StateType] = None
-        self._reply_queues: Dict[uuid.UUID, queue.Queue[Any]] = (
-            {}
-        )  # For handle_call replies
+        self._current_state = None  # type: ignore[assignment]
+        # Correlation IDs never leave the process, so a monotonic counter is
+        # enough (and much cheaper than uuid4). `count.__next__` is atomic
+        # under the GIL, so concurrent callers never share an ID.
+        self._next_correlation_id = itertools.count(1).__next__
 
     def __init_subclass__(cls):
         super().__init_subclass__()
@@ -125,15 +472,9 @@ class TypedGenServer(Generic[CastMsg, CallMsg, StateType]):
         # the TypedGenServer when it gets subclassed. We can then store those
         # type arguments in the class variables and check the types of the
         # messages against them.
-        for base in getattr(cls, "__orig_bases__", ()):
-            origin = get_origin(base)
-            if origin is not TypedGenServer:
-                continue
-            cast_t, call_t, state_t = get_args(base)
-            cls._cast_type = cast_t
-            cls._call_type = call_t
-            cls._state_type = state_t
-            return
+        type_args = _resolve_generic_bases(cls, TypedGenServer)
+        if type_args is not None:
+            cls._set_types(*type_args)
 
     # ------------- GenServer Lifecycle Management -------------
 
@@ -154,7 +495,11 @@ class TypedGenServer(Generic[CastMsg, CallMsg, StateType]):
         if self._running:
             raise GenServerError("GenServer is already running.")
         self._running = True
-        self._thread = threading.Thread(target=self._loop, args=args, kwargs=kwargs)
+        stopped_event = threading.Event()
+        self._stopped_event = stopped_event
+        self._thread = threading.Thread(
+            target=self._loop, args=(stopped_event, *args), kwargs=kwargs
+        )
         self._thread.daemon = (
             False  # Non-daemon so threads aren't killed when main returns
         )
@@ -164,7 +509,8 @@ class TypedGenServer(Generic[CastMsg, CallMsg, StateType]):
         """
         Stops the GenServer process gracefully.
 
-        Sends a stop command to the GenServer's mailbox and waits for the thread to join.
+        Sends a stop command to the GenServer's mailbox and waits for the server
+        thread to signal that it has run `terminate`.
 
         Args:
             timeout: Optional timeout in seconds to wait for the GenServer to stop.
@@ -177,47 +523,53 @@ class TypedGenServer(Generic[CastMsg, CallMsg, StateType]):
         if not self._running:
             raise GenServerError("GenServer is not running.")
         self._running = False
-        self._mailbox.put(Terminate())
-        if self._thread is None:  # FIX 2: Check if _thread is not None
-            return
-        self._thread.join(timeout=timeout)
-        # FIX 3: Check if _thread is not None before is_alive
-        if self._thread.is_alive():
+        self._post(TERMINATE)
+        if not self._stopped_event.wait(timeout):
             raise TimeoutError("GenServer failed to stop within the timeout.")
 
-    # ------------------ Message Type-checking -----------------
+    # ------------------------- Mailbox ------------------------
 
-    def assert_cast_msg(self, message: CastMsg):
-        """Asserts that the cast message is the correct type.
+    def _post(self, msg: Cast[CastMsg] | Call[CallMsg] | Terminate) -> None:
+        """Appends a message to its mailbox and wakes up the server thread.
 
         Args:
-            message (CastMsg): The message to be checked.
-
-        Raises:
-            GenServerError: If the message is not the correct type.
+            msg: The message to enqueue.
         """
-        if not isinstance(message, self._cast_type):
-            raise GenServerError(
-                "Expected cast message %s, got %s",
-                self._cast_type,
-                type(message),
-            )
+        if isinstance(msg, Cast):
+            self._mailbox_cast.append(msg)
+        else:
+            self._mailbox_call.append(msg)
+        self._mailbox_event.set()
 
-    def assert_call_message(self, message):
-        """Asserts that the call message is the correct type.
+    def _receive(self) -> List[Cast[CastMsg] | Call[CallMsg] | Terminate]:
+        """Blocks until a message is queued, then takes the next batch.
 
-        Args:
-            message (CastMsg): The message to be checked.
+        A batch is every cast queued so far (picked up with a single wakeup),
+        followed by the call (or Terminate) at the head of the call mailbox,
+        if any. Casts therefore wait behind at most one call rather than every
+        queued call, and calls behind at most one batch of casts, so neither
+        kind can starve the other. Only ever called from the server thread.
 
-        Raises:
-            GenServerError: If the message is not the correct type.
+        The call mailbox is looked at before the casts are counted, so every
+        cast a caller sent before its call is in the batch ahead of the call.
+        The one exception is a caller that timed out: casts it sends after
+        giving up on a call can still be handled before that call.
+
+        Returns:
+            The messages to process, in order.
         """
-        if not isinstance(message, self._call_type):
-            raise GenServerError(
-                "Expected call message %s, got %s",
-                self._call_type,
-                type(message),
-            )
+        casts = self._mailbox_cast
+        calls = self._mailbox_call
+        while not (casts or calls):
+            self._mailbox_event.wait()
+            self._mailbox_event.clear()
+        has_call = bool(calls)
+        batch: List[Cast[CastMsg] | Call[CallMsg] | Terminate] = [
+            casts.popleft() for _ in range(len(casts))
+        ]
+        if has_call:
+            batch.append(calls.popleft())
+        return batch
 
     # ------------------- Receiving Messages -------------------
 
@@ -237,9 +589,9 @@ class TypedGenServer(Generic[CastMsg, CallMsg, StateType]):
         if not self._running:
             raise GenServerError("Cannot cast message to a stopped GenServer.")
         # Enforce message as CastMsg type
-        self.assert_cast_msg(message=message)
+        self.assert_cast_msg(message)
         cast_message = Cast(message=message)
-        self._mailbox.put(cast_message)
+        self._post(cast_message)
 
     def call(self, message: CallMsg, timeout: Optional[float] = None) -> Any:
         """
@@ -262,74 +614,40 @@ class TypedGenServer(Generic[CastMsg, CallMsg, StateType]):
         if not self._running:
             raise GenServerError("Cannot call a stopped GenServer.")
         # Enforce call message as CallMsg type
-        self.assert_call_message(message=message)
-
-        correlation_id = uuid.uuid4()
-        reply_queue: queue.Queue[Any] = queue.Queue()
-        self._reply_queues[correlation_id] = reply_queue
-        call_message = Call(message=message, correlation_id=correlation_id)
-        self._mailbox.put(call_message)
+        self.assert_call_message(message)
+
+        # The reply slot travels with the message, so the server replies
+        # directly to it and there is no shared registry to maintain.
+        reply_slot = _ReplySlot()
+        call_message = Call(
+            message=message,
+            correlation_id=self._next_correlation_id(),
+            reply_to=reply_slot,
+        )
+        self._post(call_message)
 
-        try:
-            response = reply_queue.get(
-                timeout=timeout
-            )  # Wait for response with timeout
-            return response
-        except queue.Empty:
-            del self._reply_queues[correlation_id]  # Clean up
+        if not reply_slot.wait(timeout):  # Wait for response with timeout
             raise GenServerTimeoutError(
                 "No response received for call within timeout: %s seconds.", timeout
             )
-        finally:
-            if (
-                correlation_id in self._reply_queues
-            ):  # Ensure cleanup even if timeout didn't happen via queue.Empty
-                del self._reply_queues[correlation_id]
-
-    # ---------------------- Server State ----------------------
-
-    @property
-    def current_state(self):
-        """Get or set the current state of the TypedGenServer.
-
-        Returns:
-            StateType: The current state of the TypedGenServer.
-
-        Raises:
-            GenServerError: If the set state is not the correct type.
-        """
-        return self._current_state
-
-    @current_state.setter
-    def current_state(self, value: StateType):
-        if not isinstance(value, self._state_type):
-            raise GenServerError(
-                "Expected state %s, got %s",
-                self._state_type,
-                type(value),
-            )
-        self._current_state = value
+        return reply_slot.value
 
     # ----------------- Responding to Messages -----------------
 
-    def _reply(self, correlation_id: uuid.UUID, response: Any) -> None:
+    def _reply(self, msg: Call, response: Any) -> None:
         """
         Internal method to send a reply to a 'call' message.
 
         Used by handle_call to send the response back to the caller.
 
         Args:
-            correlation_id: The UUID of the call message to respond to.
+            msg: The call message to respond to.
             response: The response data.
         """
-        reply_queue = self._reply_queues.get(correlation_id)
-        if reply_queue:
-            reply_queue.put(response)
-        else:
+        if not msg.reply_to.put(response):
             logger.warning(
-                "Reply queue not found for correlation ID: %s. "
-                "This might indicate a programming error or timeout.",
-                correlation_id,
+                "Caller of call %s timed out before the reply was sent.",
+                msg.correlation_id,
             )
 
     def _process_call(self, msg: Call):
@@ -346,23 +664,21 @@ class TypedGenServer(Generic[CastMsg, CallMsg, StateType]):
             msg (Call): The message to process.
         """
         call_message = msg.message
-        correlation_id = msg.correlation_id
         try:
-            response, next_state = self.handle_call(call_message, self.current_state)
-            self.current_state = next_state
-            self._reply(
-                correlation_id=correlation_id,
-                response=response,
-            )
+            # Touch `_current_state` directly: the `current_state` property
+            # costs two extra method calls per message.
+            state = self._current_state
+            handler = self._call_dispatch.get(type(call_message))
+            if handler is None:
+                response, next_state = self.handle_call(call_message, state)
+            else:
+                response, next_state = handler(self, call_message, state)
+            if not self._skip_state_typecheck:
+                self.assert_state(next_state)
+            self._current_state = next_state
+            self._reply(msg, response)
         except Exception as e:
-            logger.exception(
-                "GenServer handle_call error for message: %s",
-                call_message,
-            )
-            self._reply(
-                correlation_id,
-                GenServerError("handle_call failed: %s", e),
-            )  # Reply with error
+            self._reply(msg, self._handle_call_failed(call_message, e))
 
     def _process_cast(self, msg: Cast):
         """Processes a `Cast` message:
@@ -377,15 +693,38 @@ class TypedGenServer(Generic[CastMsg, CallMsg, StateType]):
         """
         cast_message = msg.message
         try:
-            next_state = self.handle_cast(cast_message, self.current_state)
-            self.current_state = next_state
-        except Exception as e:
-            logger.exception(
-                "GenServer handle_cast error for message: %s",
-                cast_message,
-            )
+            state = self._current_state
+            handler = self._cast_dispatch.get(type(cast_message))
+            if handler is None:
+                next_state = self.handle_cast(cast_message, state)
+            else:
+                next_state = handler(self, cast_message, state)
+            if not self._skip_state_typecheck:
+                self.assert_state(next_state)
+            self._current_state = next_state
+        except Exception:
+            self._handle_cast_failed(cast_message)
+
+    def _loop(
+        self, stopped_event: threading.Event, *args: Any, **kwargs: Any
+    ) -> None:
+        """
+        Entry point of the server thread.
+
+        Runs `_serve` and then sets `stopped_event`, whichever way `_serve`
+        exits (including a failed `init`), which is what `stop` waits on.
+
+        Args:
+            stopped_event: The event `stop` is waiting on for this run.
+            *args: Positional arguments to be passed to the `init` method.
+            **kwargs: Keyword arguments to be passed to the `init` method.
+        """
+        try:
+            self._serve(*args, **kwargs)
+        finally:
+            stopped_event.set()
 
-    def _loop(self, *args: Any, **kwargs: Any) -> None:
+    def _serve(self, *args: Any, **kwargs: Any) -> None:
         """
         The main message processing loop of the GenServer.
 
@@ -403,25 +742,24 @@ class TypedGenServer(Generic[CastMsg, CallMsg, StateType]):
             self._running = False  # Stop if init fails, prevent further processing
             return  # Exit loop immediately
 
+        dispatch = self._dispatch
         while self._running:
             try:
-                msg = self._mailbox.get(
-                    timeout=0.1
-                )  # Block with timeout for responsiveness
-                if not msg:  # Spurious wakeup?
-                    continue
-                if isinstance(msg, Terminate):
-                    self._running = False
-                    break
-                elif isinstance(msg, Call):
-                    self._process_call(msg)
-                elif isinstance(msg, Cast):
-                    self._process_cast(msg)
-                else:
-                    logger.warning("Unknown message type received: %s", msg)
-
-            except queue.Empty:  # Timeout, just continue loop to check self._running
-                pass  # No message in queue, non-blocking timeout used
+                # Block until a message arrives; stop() enqueues a Terminate,
+                # so there is no need to poll `self._running`.
+                for msg in self._receive():
+                    handler = dispatch.get(type(msg))
+                    if handler is not None:
+                        handler(msg)
+                    elif isinstance(msg, Terminate):
+                        self._running = False
+                        break
+                    elif isinstance(msg, Call):
+                        self._process_call(msg)
+                    elif isinstance(msg, Cast):
+                        self._process_cast(msg)
+                    else:
+                        logger.warning("Unknown message type received: %s", msg)
 
             # Catch any unexpected errors in the loop
             except Exception as main_loop_err:
@@ -539,10 +877,6 @@ class GenServer(
         # in GenServer).
 
         super().__init_subclass__()
-        for base in getattr(cls, "__orig_bases__", ()):
-            origin = get_origin(base)
-            if origin is not GenServer:
-                continue
-            state_t = get_args(base)[0]
-            cls._state_type = state_t
-            return
+        type_args = _resolve_generic_bases(cls, GenServer)
+        if type_args is not None:
+            cls._set_types(cls._cast_type, cls._call_type, type_args[0])
@@ -4,9 +4,19 @@ Custom exceptions for the GenServer library.
 
 
 class GenServerError(Exception):
-    """Base class for GenServer related exceptions."""
+    """Base class for GenServer related exceptions.
 
-    pass
+    Accepts logging-style arguments, e.g. ``GenServerError("got %s", value)``.
+    The message is only formatted when the exception is converted to a string.
+    """
+
+    def __str__(self) -> str:
+        if len(self.args) > 1 and isinstance(self.args[0], str):
+            try:
+                return self.args[0] % self.args[1:]
+            except (TypeError, ValueError):
+                pass  # Not a format string; fall back to the default
+        return super().__str__()
 
 
 class GenServerTimeoutError(
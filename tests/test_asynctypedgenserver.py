@@ -0,0 +1,232 @@
+import asyncio
+import logging
+import unittest
+from functools import singledispatchmethod
+
+from genserver.aio import AsyncTypedGenServer
+from genserver.core import dispatch
+from genserver.exceptions import GenServerError, GenServerTimeoutError
+
+# Configure logging for tests (optional, but helpful for debugging)
+logging.basicConfig(level=logging.INFO)
+
+
+class Increment:
+    pass
+
+
+class Decrement:
+    pass
+
+
+class GetCount:
+    pass
+
+
+class IncrementAndGet:
+    pass
+
+
+class CounterServer(
+    AsyncTypedGenServer[Increment | Decrement, GetCount | IncrementAndGet, int]
+):  # Example with state as int
+    async def init(self) -> int:
+        return 0  # Initial state is 0
+
+    async def handle_cast(self, message, state: int) -> int:
+        match message:
+            case Increment():
+                return state + 1
+
+            case Decrement():
+                return state - 1
+
+            case _:
+                return await super().handle_cast(message, state)
+
+    async def handle_call(self, message, state: int) -> tuple[int, int]:
+        match message:
+            case GetCount():
+                return state, state
+
+            case IncrementAndGet():
+                new_state = state + 1
+                return new_state, new_state
+
+            case _:
+                raise NotImplementedError("Call message %s not implemented.", message)
+
+
+class ErrorCall:
+    pass
+
+
+class ErrorCast:
+    pass
+
+
+class TestAsyncGenServer(unittest.IsolatedAsyncioTestCase):
+
+    async def test_start_stop(self):
+        server = CounterServer()
+        server.start()
+        self.assertTrue(server._running)
+        await server.stop()
+        self.assertFalse(server._running)
+
+    async def test_double_start_stop(self):
+        server = CounterServer()
+        server.start()
+        with self.assertRaises(GenServerError):
+            server.start()  # Should raise error if already running
+        await server.stop()
+        with self.assertRaises(GenServerError):
+            await server.stop()  # Should raise error if already stopped
+
+    async def test_cast_and_call(self):
+        server = CounterServer()
+        server.start()
+        server.cast(Increment())
+        server.cast(Increment())
+        server.cast(Decrement())
+        count = await server.call(GetCount())  # Processed after the casts
+        self.assertEqual(count, 1)
+        new_count = await server.call(IncrementAndGet())
+        self.assertEqual(new_count, 2)
+        await server.stop()
+
+    async def test_dispatch_decorator(self):
+        @dispatch
+        class DispatchCounterServer(
+            AsyncTypedGenServer[Increment | Decrement, GetCount, int]
+        ):
+            async def init(self):
+                return 0
+
+            @singledispatchmethod
+            async def handle_cast(self, message, state):
+                return state
+
+            @handle_cast.register
+            async def _(self, message: Increment, state):
+                return state + 1
+
+            @handle_cast.register
+            async def _(self, message: Decrement, state):
+                return state - 1
+
+            async def handle_call(self, message, state):
+                return state, state
+
+        self.assertEqual(
+            set(DispatchCounterServer._cast_dispatch), {Increment, Decrement}
+        )
+        server = DispatchCounterServer()
+        server.start()
+        server.cast(Increment())
+        server.cast(Increment())
+        server.cast(Decrement())
+        self.assertEqual(await server.call(GetCount()), 1)
+        await server.stop()
+
+    async def test_message_type_checking(self):
+        server = CounterServer()
+        server.start()
+        with self.assertRaises(GenServerError):
+            server.cast(GetCount())  # Call message used as a cast
+        with self.assertRaises(GenServerError):
+            await server.call(Increment())  # Cast message used as a call
+        await server.stop()
+
+    async def test_many_servers(self):
+        servers = [CounterServer() for _ in range(1000)]
+        for server in servers:
+            server.start()
+            server.cast(Increment())
+        counts = await asyncio.gather(*(server.call(GetCount()) for server in servers))
+        self.assertEqual(counts, [1] * 1000)
+        await asyncio.gather(*(server.stop() for server in servers))
+
+    async def test_call_timeout(self):
+        class TimeoutServer(AsyncTypedGenServer[None, object, None]):
+            async def init(self):
+                return None
+
+            async def handle_call(self, message, state):
+                await asyncio.sleep(1)  # Simulate long processing
+                return "response", state
+
+        server = TimeoutServer()
+        server.start()
+        loop = asyncio.get_running_loop()
+        start_time = loop.time()
+        with self.assertRaises(GenServerTimeoutError):
+            await server.call({"action": "test"}, timeout=0.1)  # Short timeout
+        self.assertLess(loop.time() - start_time, 0.5)
+        await server.stop()
+
+    async def test_terminate_callback(self):
+        class TerminateTestServer(AsyncTypedGenServer[None, None, list]):
+            async def init(self):
+                return []
+
+            async def terminate(self, state):
+                state.append("terminated")  # Modify state on terminate
+
+        server = TerminateTestServer()
+        server.start()
+        await server.stop()
+        self.assertEqual(server._current_state, ["terminated"])
+
+    async def test_init_exception_handling(self):
+        class InitErrorServer(AsyncTypedGenServer[object, object, None]):
+            async def init(self):
+                raise ValueError("Init failed")  # Simulate init failure
+
+        server = InitErrorServer()
+        server.start()  # Start should not raise, but GenServer should stop internally
+        await asyncio.sleep(0.1)  # Give time for the task to run and stop
+        self.assertFalse(server._running)
+        with self.assertRaises(GenServerError):
+            server.cast({"action": "test"})
+        with self.assertRaises(GenServerError):
+            await server.call({"action": "test"})
+
+    async def test_handler_exception_handling(self):
+        class HandlerErrorServer(AsyncTypedGenServer[object, object, None]):
+            async def init(self):
+                return None
+
+            async def handle_cast(self, message, state):
+                if isinstance(message, ErrorCast):
+                    raise TypeError("Cast handler error")
+                return state
+
+            async def handle_call(self, message, state):
+                if isinstance(message, ErrorCall):
+                    raise ValueError("Call handler error")
+                return "response", state
+
+        server = HandlerErrorServer()
+        server.start()
+
+        with self.assertLogs("genserver.aio", level="ERROR") as logs:
+            # Cast error should be logged, but GenServer should continue running
+            server.cast(ErrorCast())
+            self.assertEqual(await server.call("ping"), "response")
+            self.assertTrue(server._running)
+
+            # Call error is returned to the caller
+            response = await server.call(ErrorCall())
+            self.assertIsInstance(response, GenServerError)
+            self.assertEqual(str(response), "handle_call failed: Call handler error")
+
+        self.assertEqual(len(logs.records), 2)
+        self.assertIn("handle_cast error", logs.output[0])
+        self.assertIn("handle_call error", logs.output[1])
+
+        await server.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
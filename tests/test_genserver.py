@@ -178,6 +178,19 @@ class TestGenServer(unittest.TestCase):
 
         server.stop()
 
+    def test_error_message_formatting(self):
+        self.assertEqual(str(GenServerError("plain message")), "plain message")
+        self.assertEqual(
+            str(GenServerError("Expected %s, got %s", dict, list)),
+            "Expected <class 'dict'>, got <class 'list'>",
+        )
+        # Arguments that don't match the format string are shown as-is
+        self.assertEqual(str(GenServerError("100%", 1)), "('100%', 1)")
+        self.assertEqual(
+            str(GenServerTimeoutError("Timed out after %s seconds.", 0.1)),
+            "Timed out after 0.1 seconds.",
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,9 +1,16 @@
 from functools import singledispatchmethod
 import logging
+import threading
 import time
 import unittest
 
-from genserver.core import TypedGenServer, GenServerError, GenServerTimeoutError
+from genserver.core import (
+    GenServerError,
+    GenServerTimeoutError,
+    TypedGenServer,
+    _ReplySlot,
+    dispatch,
+)
 
 # Configure logging for tests (optional, but helpful for debugging)
 logging.basicConfig(level=logging.INFO)
@@ -118,6 +125,147 @@ class TestGenServer(unittest.TestCase):
         self.assertEqual(count, 1)
         server.stop()
 
+    def test_cast_burst(self):
+        server = CounterServer()
+        server.start()
+        for _ in range(1000):
+            server.cast(Increment())
+        count = server.call(GetCount())  # Processed after every queued cast
+        self.assertEqual(count, 1000)
+        server.stop()
+
+    def test_casts_overtake_queued_calls(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        class RecorderServer(TypedGenServer[str, str, list]):
+            def init(self):
+                return []
+
+            def handle_cast(self, message, state):
+                return state + [message]
+
+            def handle_call(self, message, state):
+                if message == "slow":
+                    started.set()
+                    release.wait()
+                return list(state), state
+
+        server = RecorderServer()
+        server.start()
+        results = []
+        slow_caller = threading.Thread(target=server.call, args=("slow",))
+        caller = threading.Thread(target=lambda: results.append(server.call("get")))
+        try:
+            slow_caller.start()
+            started.wait()  # The slow call is now being handled
+            caller.start()
+            while not server._mailbox_call:  # Wait until "get" is queued
+                time.sleep(0.001)
+            server.cast("a")
+            server.cast("b")
+        finally:
+            release.set()
+            slow_caller.join()
+            caller.join()
+            server.stop()
+        self.assertEqual(results, [["a", "b"]])  # Casts went before the call
+
+    def test_casts_dont_starve_calls(self):
+        server = CounterServer()
+        server.start()
+        flooding = True
+
+        def flood():
+            while flooding:
+                server.cast(Increment())
+
+        flooders = [threading.Thread(target=flood) for _ in range(2)]
+        try:
+            for flooder in flooders:
+                flooder.start()
+            for _ in range(10):
+                server.call(GetCount(), timeout=5)
+        finally:
+            flooding = False
+            for flooder in flooders:
+                flooder.join()
+            server.stop()
+
+    def test_dispatch_decorator(self):
+        class SpecialIncrement(Increment):
+            pass
+
+        @dispatch
+        class DispatchCounterServer(CounterServer):
+            pass
+
+        self.assertEqual(
+            set(DispatchCounterServer._cast_dispatch), {Increment, Decrement}
+        )
+        self.assertEqual(DispatchCounterServer._call_dispatch, {})  # Not dispatched
+
+        server = DispatchCounterServer()
+        server.start()
+        server.cast(Increment())
+        server.cast(Increment())
+        server.cast(Decrement())
+        server.cast(SpecialIncrement())  # Falls back to handle_cast
+        self.assertEqual(server.call(GetCount()), 2)
+        server.stop()
+
+        class OverridingServer(DispatchCounterServer):
+            def handle_cast(self, message, state):
+                return state + 10
+
+        self.assertEqual(OverridingServer._cast_dispatch, {})
+        server = OverridingServer()
+        server.start()
+        server.cast(Increment())
+        self.assertEqual(server.call(GetCount()), 10)
+        server.stop()
+
+    def test_message_type_checking(self):
+        class SpecialIncrement(Increment):
+            pass
+
+        server = CounterServer()
+        server.start()
+        server.cast(SpecialIncrement())  # Subclasses of a union member pass
+        with self.assertRaises(GenServerError):
+            server.cast(GetCount())  # Call message used as a cast
+        with self.assertRaises(GenServerError):
+            server.call(Increment())  # Cast message used as a call
+        count = server.call(GetCount())
+        self.assertEqual(count, 1)
+        server.stop()
+
+    def test_state_type_checking(self):
+        class BadStateServer(TypedGenServer[object, object, int]):
+            def init(self):
+                return 0
+
+            def handle_cast(self, message, state):
+                return str(state)  # Wrong state type
+
+            def handle_call(self, message, state):
+                return state, state
+
+        server = BadStateServer()
+        server.start()
+        server.cast("bad")
+        self.assertEqual(server.call("get"), 0)  # Bad state was rejected
+        server.stop()
+
+        class UncheckedStateServer(BadStateServer):
+            _skip_state_typecheck = True
+
+        server = UncheckedStateServer()
+        server.start()
+        server.cast("bad")
+        self.assertEqual(server.call("get"), "0")  # Bad state was not checked
+        server.stop()
+
     def test_call_timeout(self):
         class TimeoutServer(TypedGenServer[None, object, None]):
             def init(self):
@@ -138,6 +286,54 @@ class TestGenServer(unittest.TestCase):
         )  # Should be much less than 1 sec sleep in handler
         server.stop()
 
+    def test_late_reply(self):
+        release = threading.Event()
+
+        class LateServer(TypedGenServer[None, str, None]):
+            def init(self):
+                return None
+
+            def handle_call(self, message, state):
+                if message == "late":
+                    release.wait()
+                return message, state
+
+        server = LateServer()
+        server.start()
+        with self.assertRaises(GenServerTimeoutError):
+            server.call("late", timeout=0.01)
+        with self.assertLogs("genserver.core", level="WARNING") as logs:
+            release.set()
+            # Handled after the late reply was dropped
+            self.assertEqual(server.call("next"), "next")
+        self.assertIn("timed out before the reply was sent", logs.output[0])
+        server.stop()
+
+    def test_reply_slot(self):
+        slot = _ReplySlot()
+        self.assertTrue(slot.put("reply"))
+        self.assertTrue(slot.wait(0))
+        self.assertEqual(slot.value, "reply")
+
+        slot = _ReplySlot()
+        self.assertFalse(slot.wait(0))  # Caller gives up first
+        self.assertFalse(slot.put("reply"))  # So the reply is dropped
+
+        # The server claims the slot just before the caller's timeout: the
+        # caller must still get the reply.
+        slot = _ReplySlot()
+        slot.claim.acquire()
+
+        def finish_put():
+            slot.value = 1
+            slot.event.set()
+
+        timer = threading.Timer(0.05, finish_put)
+        timer.start()
+        self.assertTrue(slot.wait(0))
+        self.assertEqual(slot.value, 1)
+        timer.join()
+
     def test_terminate_callback(self):
         class TerminateTestServer(TypedGenServer[None, None, list]):
             def init(self):
@@ -153,6 +349,28 @@ class TestGenServer(unittest.TestCase):
             server._current_state, ["terminated"]
         )  # Check state after stop
 
+    def test_stop_timeout(self):
+        release = threading.Event()
+
+        class SlowServer(TypedGenServer[object, None, None]):
+            def init(self):
+                return None
+
+            def handle_cast(self, message, state):
+                release.wait()
+                return state
+
+        server = SlowServer()
+        server.start()
+        server.cast(object())
+        try:
+            with self.assertRaises(TimeoutError):
+                server.stop(timeout=0.1)
+        finally:
+            release.set()
+        # The server thread still signals once it has terminated.
+        self.assertTrue(server._stopped_event.wait(1))
+
     def test_init_exception_handling(self):
         class InitErrorServer(TypedGenServer[object, object, None]):
             def init(self):
@@ -168,6 +386,7 @@ class TestGenServer(unittest.TestCase):
         server.start()  # Start should not raise, but GenServer should stop internally
         time.sleep(0.1)  # Give time for thread to run and stop
         self.assertFalse(server._running)  # Should not be running after init failure
+        self.assertTrue(server._stopped_event.is_set())
         with self.assertRaises(GenServerError):  # Check cast and call fail
             server.cast({"action": "test"})
         with self.assertRaises(GenServerError):